@@ -3,20 +3,28 @@ Mercor Referral Network Implementation
 
 This module implements the core referral network functionality including:
 - Referral graph management with constraint enforcement
-- Network reach calculations using BFS
+- Network reach calculations using subtree traversal
 - Influence metrics computation
 - Top referrer rankings
 
 Time Complexity Analysis:
-- Adding referral: O(1) average case, O(n) worst case for cycle detection
-- Computing reach: O(V + E) where V = vertices, E = edges
-- Top k referrers: O(n log n) for sorting
-- Influence metrics: O(V^2 * E) for all-pairs shortest paths
+- Adding referral: O(depth) for cycle detection via the referrer's ancestor chain
+- Computing reach: O(V + E) where V = vertices, E = edges, cached until the next insert
+- Top k referrers: O(V + E) subtree sizes + O(V log k) partial sort
+- Influence metrics: O(V + E) flow centrality (closed-form Brandes on a forest)
 """
 
-from collections import defaultdict, deque
+from array import array
+from collections import deque
 from typing import Dict, List, Set, Tuple, Optional
 import heapq
+import operator
+
+
+# Validation messages, shared so the success path builds no strings
+_EMPTY_USER_MESSAGE = "Referrer and candidate must be non-empty strings"
+_SELF_REFERRAL_MESSAGE = "Self-referrals are not allowed"
+_CYCLE_MESSAGE = "Adding this referral would create a cycle in the network"
 
 
 class ReferralNetwork:
@@ -32,8 +40,19 @@ class ReferralNetwork:
     def __init__(self):
         """Initialize an empty referral network."""
         self.referrals: Dict[str, str] = {}  # candidate -> referrer
-        self.reverse_referrals: Dict[str, Set[str]] = defaultdict(set)  # referrer -> candidates
+        self.reverse_referrals: Dict[str, List[str]] = {}  # referrer -> candidates, only for active referrers
         self.users: Set[str] = set()
+        self._active_referrer_count = 0  # users with at least one direct referral
+        
+        # Lazily populated reach cache, invalidated along the ancestor chain on insert
+        self._subtree_size: Dict[str, int] = {}  # user -> total referral count
+        
+        # Integer ids for users and a lazily rebuilt CSR adjacency over those ids
+        self._id_of: Dict[str, int] = {}  # user -> id
+        self._users_by_id: List[str] = []  # id -> user
+        self._parent_ids: array = array('i')  # id -> referrer id, -1 for roots
+        self._csr: Optional[Tuple[array, array]] = None  # (indptr, indices), None when stale
+        self._reach_masks: Optional[List[int]] = None  # id -> reach bitmask, None when stale
     
     def add_referral(self, referrer: str, candidate: str) -> bool:
         """
@@ -49,34 +68,126 @@ class ReferralNetwork:
         Raises:
             ValueError: If constraints are violated
         """
-        # Validate inputs
-        if not referrer or not candidate:
-            raise ValueError("Referrer and candidate must be non-empty strings")
+        self._validate_users(referrer, candidate)
         
-        if referrer == candidate:
-            raise ValueError("Self-referrals are not allowed")
-        
-        # Check if candidate already has a referrer
+        # Check if candidate already has a referrer; the message is only formatted on failure
         if candidate in self.referrals:
             raise ValueError(f"Candidate {candidate} already has a referrer")
         
         # Check if adding this edge would create a cycle
         if self._would_create_cycle(referrer, candidate):
-            raise ValueError("Adding this referral would create a cycle in the network")
+            raise ValueError(_CYCLE_MESSAGE)
         
         # Add the referral
         self.referrals[candidate] = referrer
-        self.reverse_referrals[referrer].add(candidate)
+        # Candidates are unique (enforced above), so a list needs no dedup.
+        # Lists are created on a user's first referral, never by reads.
+        direct_referrals = self.reverse_referrals.get(referrer)
+        if direct_referrals is None:
+            self.reverse_referrals[referrer] = [candidate]
+            self._active_referrer_count += 1
+        else:
+            direct_referrals.append(candidate)
         self.users.add(referrer)
         self.users.add(candidate)
+        self._parent_ids[self._intern_user(candidate)] = self._intern_user(referrer)
+        self._csr = None
+        self._reach_masks = None
+        
+        # Only the referrer and its ancestors gain reach from the new edge
+        self._invalidate_reach_caches(referrer)
         
         return True
     
+    @staticmethod
+    def _validate_users(referrer: str, candidate: str) -> None:
+        """
+        Check the referral constraints that do not depend on the network.
+        
+        Args:
+            referrer: The user making the referral
+            candidate: The user being referred
+            
+        Raises:
+            ValueError: If either user is empty or the referral is to oneself
+        """
+        if not referrer or not candidate:
+            raise ValueError(_EMPTY_USER_MESSAGE)
+        
+        if referrer == candidate:
+            raise ValueError(_SELF_REFERRAL_MESSAGE)
+    
+    def _invalidate_reach_caches(self, user: str) -> None:
+        """
+        Drop cached subtree sizes for a user and all of their ancestors.
+        
+        The cache is filled bottom-up, so a cached user always has every
+        descendant cached too. Once an ancestor holds no cached entry, none of
+        its own ancestors can, and the walk stops early.
+        
+        Args:
+            user: The user whose downstream network has changed
+        """
+        current = user
+        while current is not None:
+            if self._subtree_size.pop(current, None) is None:
+                break
+            current = self.referrals.get(current)
+    
+    def _intern_user(self, user: str) -> int:
+        """
+        Get the integer id of a user, assigning the next free id if new.
+        
+        Args:
+            user: The user to look up
+            
+        Returns:
+            int: The user's id
+        """
+        user_id = self._id_of.get(user)
+        if user_id is None:
+            user_id = len(self._users_by_id)
+            self._id_of[user] = user_id
+            self._users_by_id.append(user)
+            self._parent_ids.append(-1)
+        return user_id
+    
+    def _get_csr(self) -> Tuple[array, array]:
+        """
+        Get the referral graph as compressed sparse row (CSR) adjacency over user ids.
+        
+        The children of user id u are indices[indptr[u]:indptr[u + 1]], stored
+        as contiguous C ints. The arrays are rebuilt only after the graph changes.
+        
+        Returns:
+            Tuple[array, array]: (indptr, indices) arrays of type 'i'
+        """
+        # Users may also be added to self.users directly, without any referrals
+        if len(self._users_by_id) != len(self.users):
+            for user in self.users:
+                self._intern_user(user)
+            self._csr = None
+            self._reach_masks = None
+        
+        if self._csr is None:
+            indptr = array('i', [0])
+            indices = array('i')
+            for user in self._users_by_id:
+                indices.extend(self._id_of[c] for c in self.reverse_referrals.get(user, ()))
+                indptr.append(len(indices))
+            self._csr = (indptr, indices)
+        
+        return self._csr
+    
     def _would_create_cycle(self, referrer: str, candidate: str) -> bool:
         """
         Check if adding an edge from referrer to candidate would create a cycle.
         
-        Uses DFS to detect cycles in the potential graph.
+        A cycle forms only if referrer is already downstream of candidate. Since
+        every user has at most one referrer, that is equivalent to candidate
+        appearing on referrer's ancestor chain, so we walk up from referrer
+        instead of searching candidate's whole subtree: O(depth), no allocation.
+        The walk follows the flat parent id array rather than hashing names.
         
         Args:
             referrer: The potential referrer
@@ -85,24 +196,19 @@ class ReferralNetwork:
         Returns:
             bool: True if adding the edge would create a cycle
         """
-        # If referrer is already reachable from candidate, adding the edge creates a cycle
-        visited = set()
-        stack = [candidate]
+        # A candidate who has referred nobody (including a brand new user)
+        # cannot reach the referrer, which covers the common insertion in O(1)
+        if not self.reverse_referrals.get(candidate):
+            return False
         
-        while stack:
-            current = stack.pop()
-            if current == referrer:
+        # A referrer without an id is new to the network and has no ancestors
+        candidate_id = self._id_of[candidate]
+        parent_ids = self._parent_ids
+        current = self._id_of.get(referrer, -1)
+        while current != -1:
+            if current == candidate_id:
                 return True
-            
-            if current in visited:
-                continue
-                
-            visited.add(current)
-            
-            # Add all candidates that current refers to the stack
-            for next_candidate in self.reverse_referrals[current]:
-                if next_candidate not in visited:
-                    stack.append(next_candidate)
+            current = parent_ids[current]
         
         return False
     
@@ -116,11 +222,14 @@ class ReferralNetwork:
         Returns:
             List[str]: List of users directly referred by the given user
         """
-        return list(self.reverse_referrals.get(user, set()))
+        return list(self.reverse_referrals.get(user, ()))
     
     def get_total_referral_count(self, user: str) -> int:
         """
-        Get total referral count (direct + indirect) for a user using BFS.
+        Get total referral count (direct + indirect) for a user.
+        
+        Computed as the size of the user's referral subtree, reusing any
+        cached subtree sizes of their descendants.
         
         Args:
             user: The user whose total referral count to compute
@@ -131,24 +240,7 @@ class ReferralNetwork:
         if user not in self.users:
             return 0
         
-        visited = set()
-        queue = deque([user])
-        count = 0
-        
-        while queue:
-            current = queue.popleft()
-            if current in visited:
-                continue
-                
-            visited.add(current)
-            
-            # Add all direct referrals to the queue
-            for candidate in self.reverse_referrals[current]:
-                if candidate not in visited:
-                    queue.append(candidate)
-                    count += 1
-        
-        return count
+        return self._accumulate_subtree_sizes(user)
     
     def get_top_referrers(self, k: int) -> List[Tuple[str, int]]:
         """
@@ -160,16 +252,67 @@ class ReferralNetwork:
         Returns:
             List[Tuple[str, int]]: List of (user, total_referrals) tuples, sorted by count
         """
-        referrer_counts = []
+        subtree_sizes = self._compute_subtree_sizes()
+        
+        # Only include users who have made referrals
+        referrer_counts = ((user, size) for user, size in subtree_sizes.items() if size > 0)
+        
+        # Partial sort: O(V log k) instead of sorting every referrer
+        return heapq.nlargest(k, referrer_counts, key=operator.itemgetter(1))
+    
+    def _compute_subtree_sizes(self) -> Dict[str, int]:
+        """
+        Compute total referral count for every user in a single pass.
         
-        for user in self.users:
-            total_count = self.get_total_referral_count(user)
-            if total_count > 0:  # Only include users who have made referrals
-                referrer_counts.append((user, total_count))
+        Since each candidate has exactly one referrer, the network is a forest
+        and a user's total reach is the size of their subtree:
+        reach[u] = |children(u)| + sum(reach[c] for c in children(u)).
+        Sizes are accumulated with an iterative post-order DFS from each root,
+        giving O(V + E) overall instead of one BFS per user. Subtrees whose
+        size is already cached are not descended into.
         
-        # Sort by count (descending) and return top k
-        referrer_counts.sort(key=lambda x: x[1], reverse=True)
-        return referrer_counts[:k]
+        Returns:
+            Dict[str, int]: Mapping of each user to their total referral count
+        """
+        for root in self.users:
+            if root not in self.referrals:  # Descendants are visited from their root
+                self._accumulate_subtree_sizes(root)
+        
+        return self._subtree_size
+    
+    def _accumulate_subtree_sizes(self, user: str) -> int:
+        """
+        Compute and cache subtree sizes for a user and all of their descendants.
+        
+        Uses an iterative post-order DFS that only counts, with no visited set:
+        the forest structure guarantees each descendant is reached exactly once.
+        Subtrees whose size is already cached are not descended into.
+        
+        Args:
+            user: Root of the subtree to size
+            
+        Returns:
+            int: Number of users in the subtree, excluding the user themselves
+        """
+        subtree_sizes = self._subtree_size
+        if user in subtree_sizes:
+            return subtree_sizes[user]
+        
+        stack = [(user, False)]
+        while stack:
+            current, children_done = stack.pop()
+            children = self.reverse_referrals.get(current, ())
+            
+            if children_done:
+                subtree_sizes[current] = sum(1 + subtree_sizes[c] for c in children)
+                continue
+            
+            stack.append((current, True))
+            for candidate in children:
+                if candidate not in subtree_sizes:
+                    stack.append((candidate, False))
+        
+        return subtree_sizes[user]
     
     def get_unique_reach_expansion(self) -> List[Tuple[str, int]]:
         """
@@ -180,8 +323,9 @@ class ReferralNetwork:
         Useful for targeted marketing campaigns and influencer selection.
         
         Algorithm: Greedy set cover approach
-        1. Calculate reachable users for each user
-        2. Iteratively select user with maximum new unique coverage
+        1. Calculate reachable users for each user as bitmasks, bottom-up
+        2. Iteratively select user with maximum new unique coverage, using a
+           lazily updated max-heap instead of rescanning every user each round
         3. Update remaining uncovered users after each selection
         4. Continue until all users are covered or no more coverage possible
         
@@ -191,80 +335,119 @@ class ReferralNetwork:
         if not self.users:
             return []
         
-        # Calculate reachable users for each user
-        user_reaches = {}
-        for user in self.users:
-            reachable = self._get_reachable_users(user)
-            if reachable:
-                user_reaches[user] = reachable
+        # Reach set of every user as an int bitmask (bit i = user id i), so that
+        # intersections and removals run as word-wide bitwise ops in C
+        reach_masks = self._compute_reach_masks()
+        user_reaches = {self._users_by_id[u]: mask for u, mask in enumerate(reach_masks) if mask}
         
         if not user_reaches:
             return []
         
         # Greedy set cover algorithm
         selected_users = []
-        remaining_uncovered = set()
+        remaining_uncovered = 0
         
         # Initialize with all users that can be reached by any referrer
-        for reachable_set in user_reaches.values():
-            remaining_uncovered.update(reachable_set)
+        for reach_mask in user_reaches.values():
+            remaining_uncovered |= reach_mask
+        
+        # Max-heap of (negated coverage, user). Coverage only shrinks as users are
+        # covered, so a stale key is an upper bound: on pop, recompute the actual
+        # coverage and accept the user only if it still matches the key,
+        # otherwise push it back with the refreshed value (lazy evaluation).
+        coverage_heap = [(-mask.bit_count(), user) for user, mask in user_reaches.items()]
+        heapq.heapify(coverage_heap)
         
         # Iteratively select users with maximum new coverage
-        while remaining_uncovered and user_reaches:
-            best_user = None
-            best_new_coverage = 0
+        while remaining_uncovered and coverage_heap:
+            neg_coverage, user = heapq.heappop(coverage_heap)
+            reach_mask = user_reaches[user]
+            new_coverage = (reach_mask & remaining_uncovered).bit_count()
             
-            # Find user with maximum new unique coverage
-            for user, reachable in user_reaches.items():
-                new_coverage = len(reachable.intersection(remaining_uncovered))
-                if new_coverage > best_new_coverage:
-                    best_new_coverage = new_coverage
-                    best_user = user
+            if new_coverage == 0:
+                continue  # Can never contribute again
             
-            if best_user is None or best_new_coverage == 0:
-                break
+            if new_coverage != -neg_coverage:
+                heapq.heappush(coverage_heap, (-new_coverage, user))
+                continue
             
             # Select this user and update coverage
-            selected_users.append((best_user, best_new_coverage))
-            remaining_uncovered -= user_reaches[best_user]
-            
-            # Remove selected user from consideration
-            del user_reaches[best_user]
+            selected_users.append((user, new_coverage))
+            remaining_uncovered &= ~reach_mask
         
         # Sort by coverage (descending)
         selected_users.sort(key=lambda x: x[1], reverse=True)
         return selected_users
     
+    def _topological_order(self) -> List[int]:
+        """
+        Order all user ids so that every referrer comes before their candidates.
+        
+        Runs a BFS from every root (users without a referrer) over the CSR adjacency.
+        
+        Returns:
+            List[int]: User ids in parents-before-children order
+        """
+        indptr, indices = self._get_csr()
+        
+        order = [u for u, parent in enumerate(self._parent_ids) if parent == -1]
+        position = 0
+        while position < len(order):
+            u = order[position]
+            order.extend(indices[indptr[u]:indptr[u + 1]])
+            position += 1
+        
+        return order
+    
+    def _compute_reach_masks(self) -> List[int]:
+        """
+        Compute the reach set of every user as an int bitmask indexed by user id.
+        
+        Users are taken in parents-before-children order and folded in reverse,
+        so each child is finished before its referrer: mask[u] = OR(mask[c] | 1 << c for c in children(u)).
+        This is one O(V + E) pass of bitwise ops, without building string sets.
+        The masks are cached alongside the CSR and dropped whenever it is.
+        
+        Returns:
+            List[int]: Reach bitmask for each user id
+        """
+        indptr, indices = self._get_csr()
+        if self._reach_masks is not None:
+            return self._reach_masks
+        
+        order = self._topological_order()
+        
+        reach_masks = [0] * len(order)
+        for u in reversed(order):
+            mask = 0
+            for c in indices[indptr[u]:indptr[u + 1]]:
+                mask |= reach_masks[c] | (1 << c)
+            reach_masks[u] = mask
+        
+        self._reach_masks = reach_masks
+        return reach_masks
+    
     def _get_reachable_users(self, user: str) -> Set[str]:
         """
         Get set of all users reachable from a given user.
         
+        Each candidate has exactly one referrer, so the subtree below a user
+        contains every descendant exactly once. A plain stack-based DFS over
+        the child lists collects them without a visited set.
+        
         Args:
             user: The user whose reachable users to compute
             
         Returns:
             Set[str]: Set of users reachable from this user
         """
-        if user not in self.users:
-            return set()
-        
         reachable = set()
-        queue = deque([user])
-        
-        while queue:
-            current = queue.popleft()
-            if current in reachable:
-                continue
-                
+        stack = list(self.reverse_referrals.get(user, ()))
+        while stack:
+            current = stack.pop()
             reachable.add(current)
-            
-            # Add all direct referrals to the queue
-            for candidate in self.reverse_referrals[current]:
-                if candidate not in reachable:
-                    queue.append(candidate)
+            stack.extend(self.reverse_referrals.get(current, ()))
         
-        # Remove the user themselves from reachable set
-        reachable.discard(user)
         return reachable
     
     def get_flow_centrality(self) -> List[Tuple[str, int]]:
@@ -274,10 +457,13 @@ class ReferralNetwork:
         Flow centrality measures how many shortest paths between other users
         pass through a given user, indicating their importance in the network.
         
-        Algorithm: All-pairs shortest paths using BFS
-        - For each pair of users (s, t), compute shortest path distance
+        Algorithm: Brandes' betweenness accumulation, specialized to a forest
         - A node v is on a shortest path from s to t if dist(s,v) + dist(v,t) == dist(s,t)
-        - Count how many such shortest paths pass through each user
+        - Brandes sums, over sources s, the number of targets whose shortest path
+          from s runs through v
+        - Each candidate has a single referrer, so the sources with paths through v
+          are exactly its ancestors, and each of them reaches every descendant of v
+          through v. The score is depth(v) * subtree_size(v), computed in O(V + E)
         
         Returns:
             List[Tuple[str, int]]: List of (user, centrality_score) tuples, sorted by score
@@ -285,117 +471,69 @@ class ReferralNetwork:
         if len(self.users) < 3:
             return []
         
-        centrality_scores = {user: 0 for user in self.users}
-        user_list = list(self.users)
-        
-        # Pre-compute all-pairs shortest paths for efficiency
-        all_distances = {}
-        for user in user_list:
-            all_distances[user] = self._compute_shortest_paths(user)
-        
-        # Check all pairs of users (both directions)
-        for i, user1 in enumerate(user_list):
-            for j, user2 in enumerate(user_list):
-                if i == j:  # Skip same user
-                    continue
-                
-                # Check if there's a path from user1 to user2
-                if user2 in all_distances[user1]:
-                    shortest_distance = all_distances[user1][user2]
-                    
-                    # Check each user to see if they're on a shortest path
-                    for user3 in self.users:
-                        if user3 == user1 or user3 == user2:
-                            continue
-                        
-                        # Check if user3 is on a shortest path from user1 to user2
-                        if self._is_on_shortest_path(user1, user2, user3, 
-                                                   all_distances[user1], all_distances[user3]):
-                            centrality_scores[user3] += 1
+        indptr, indices = self._get_csr()
+        user_list = self._users_by_id
+        subtree_sizes = self._compute_subtree_sizes()
+        
+        # Depth of every user below their root, propagated parents-before-children
+        depth = [0] * len(user_list)
+        for u in self._topological_order():
+            for c in indices[indptr[u]:indptr[u + 1]]:
+                depth[c] = depth[u] + 1
+        
+        centrality_scores = [depth[u] * subtree_sizes[user] for u, user in enumerate(user_list)]
         
         # Sort by centrality score (descending)
-        sorted_users = sorted(centrality_scores.items(), key=lambda x: x[1], reverse=True)
+        sorted_users = sorted(zip(user_list, centrality_scores), key=lambda x: x[1], reverse=True)
         return sorted_users
     
     def _compute_shortest_paths(self, start: str) -> Dict[str, int]:
         """
         Compute shortest path distances from start to all other users using BFS.
         
+        The search runs over integer ids and the CSR adjacency; names are only
+        looked up for the returned mapping.
+        
         Args:
             start: Starting user for shortest path computation
             
         Returns:
             Dict[str, int]: Dictionary mapping users to their shortest path distance from start
         """
-        distances = {start: 0}
-        queue = deque([start])
+        if start not in self.users:
+            return {start: 0}
+        
+        indptr, indices = self._get_csr()
+        start_id = self._id_of[start]
+        
+        distances = {start_id: 0}
+        queue = deque([start_id])
         
         while queue:
             current = queue.popleft()
             current_distance = distances[current]
             
             # Add all direct referrals to the queue
-            for candidate in self.reverse_referrals[current]:
+            for candidate in indices[indptr[current]:indptr[current + 1]]:
                 if candidate not in distances:
                     distances[candidate] = current_distance + 1
                     queue.append(candidate)
         
-        return distances
-    
-    def _is_on_shortest_path(self, start: str, end: str, target: str, 
-                            distances_from_start: Dict[str, int], 
-                            distances_from_target: Dict[str, int]) -> bool:
-        """
-        Check if target user is on a shortest path from start to end.
-        
-        A user v is on a shortest path from s to t if and only if:
-        dist(s,v) + dist(v,t) == dist(s,t)
-        
-        Args:
-            start: Starting user
-            end: Ending user
-            target: User to check if on shortest path
-            distances_from_start: Shortest path distances from start
-            distances_from_target: Shortest path distances from target
-            
-        Returns:
-            bool: True if target is on a shortest path from start to end
-        """
-        if start == end or start == target or end == target:
-            return False
-        
-        # Check if there's a path from start to end
-        if end not in distances_from_start:
-            return False
-        
-        # Check if target is reachable from start
-        if target not in distances_from_start:
-            return False
-        
-        # Check if end is reachable from target
-        if end not in distances_from_target:
-            return False
-        
-        # Check the shortest path condition: dist(s,v) + dist(v,t) == dist(s,t)
-        dist_start_to_target = distances_from_start[target]
-        dist_target_to_end = distances_from_target[end]
-        dist_start_to_end = distances_from_start[end]
-        
-        return dist_start_to_target + dist_target_to_end == dist_start_to_end
+        users_by_id = self._users_by_id
+        return {users_by_id[u]: distance for u, distance in distances.items()}
     
     def get_network_stats(self) -> Dict[str, int]:
         """
         Get basic network statistics.
         
+        Every statistic is an O(1) read: the active referrer count is
+        maintained by add_referral as users make their first referral.
+        
         Returns:
             Dict[str, int]: Dictionary with network statistics
         """
-        total_users = len(self.users)
-        total_referrals = len(self.referrals)
-        active_referrers = len([u for u in self.users if self.get_total_referral_count(u) > 0])
-        
         return {
-            'total_users': total_users,
-            'total_referrals': total_referrals,
-            'active_referrers': active_referrers
+            'total_users': len(self.users),
+            'total_referrals': len(self.referrals),
+            'active_referrers': self._active_referrer_count
         }
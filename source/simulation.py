@@ -7,16 +7,169 @@ This module implements:
 - Mathematical modeling of referral adoption rates
 
 Time Complexity Analysis:
-- simulate: O(days * active_referrers)
-- days_to_target: O(log(target_total) * active_referrers)
-- min_bonus_for_target: O(log(bonus_range) * days * active_referrers)
+- simulate: O(referrers * capacity + days) via geometric skip-sampling
+- simulate_many: O(n_reps * (referrers * capacity + days))
+- simulate_expected: O(days) via a closed form
+- days_to_target: O(1) analytic solution
+- min_bonus_for_target: O(log(bonus_range / 10)) closed-form evaluations
 """
 
+from array import array
+from collections import OrderedDict
+import functools
+import itertools
 import math
-from typing import List, Optional, Tuple
+from typing import Callable, List, MutableSequence, Optional, Tuple
 import random
 
 
+# Validation messages, shared so the success path builds no strings
+_PROBABILITY_RANGE_MESSAGE = "Probability p must be between 0.0 and 1.0"
+_NEGATIVE_DAYS_MESSAGE = "Days must be non-negative"
+_NEGATIVE_REPLICATES_MESSAGE = "Number of replicates must be non-negative"
+
+# Referral model shared by the simulator and the bonus optimizer
+_INITIAL_ACTIVE_REFERRERS = 100
+_MAX_REFERRALS_PER_REFERRER = 10
+
+# Most min_bonus_for_target results each optimizer keeps (least recently used evicted)
+_MIN_BONUS_CACHE_SIZE = 128
+
+
+def _saturation_day(p: float, max_referrals: int) -> int:
+    """
+    First day on which every referrer is expected to be at capacity.
+    
+    Callers must ensure the referrers saturate within a representable number
+    of days (p * days >= max_referrals).
+    
+    Args:
+        p: Probability of successful referral per day (0.0 to 1.0]
+        max_referrals: Referral capacity of each referrer
+        
+    Returns:
+        int: Smallest day d >= 1 with d * p >= max_referrals
+    """
+    saturation_day = max(1, math.ceil(max_referrals / p))
+    while saturation_day > 1 and (saturation_day - 1) * p >= max_referrals:
+        saturation_day -= 1
+    while saturation_day * p < max_referrals:
+        saturation_day += 1
+    return saturation_day
+
+
+def _expected_curve(p: float, days: int, referrers: int, max_referrals: int) -> List[float]:
+    """
+    Closed-form cumulative expected referrals for each day.
+    
+    Each day matches NetworkSimulator._expected_total: the curve grows linearly
+    until the saturation day and is filled with the capacity after it, without
+    evaluating min() per day. A fresh list is built on every call.
+    
+    Args:
+        p: Probability of successful referral per day (0.0 to 1.0)
+        days: Number of days to simulate
+        referrers: Number of initial active referrers
+        max_referrals: Referral capacity of each referrer
+        
+    Returns:
+        List[float]: Cumulative expected referrals after each day
+    """
+    if p <= 0.0:
+        return [0.0] * days
+    
+    # Referrers never reach capacity within the horizon: only linear growth.
+    # This also covers tiny p, where max_referrals / p is not a finite day count.
+    if days * p < max_referrals:
+        growth_days = days
+    else:
+        growth_days = _saturation_day(p, max_referrals) - 1
+    
+    # Linear growth up to saturation, then a flat plateau at full capacity
+    curve = [day * p * referrers for day in range(1, growth_days + 1)]
+    curve.extend([float(max_referrals * referrers)] * (days - growth_days))
+    return curve
+
+
+def _min_probability_for_target(days: int, target_total: int, referrers: int,
+                                max_referrals: int) -> Optional[float]:
+    """
+    Smallest probability whose expected total after the given days meets the target.
+    
+    Inverts the closed form min(days * p, max_referrals) * referrers: below
+    capacity the total is days * p * referrers, so p = target / (referrers * days).
+    The estimate is then stepped one float at a time until it is exactly the
+    boundary of that total >= target, so comparing a probability against it
+    agrees with NetworkSimulator._expected_total.
+    
+    Args:
+        days: Number of days elapsed (positive)
+        target_total: Target number of total referrals (positive)
+        referrers: Number of initial active referrers
+        max_referrals: Referral capacity of each referrer
+        
+    Returns:
+        Optional[float]: Minimum probability, or None if even p = 1.0 falls short
+    """
+    def expected_total(p: float) -> float:
+        return min(days * p, max_referrals) * referrers
+    
+    if expected_total(1.0) < target_total:
+        return None
+    
+    p = min(target_total / (referrers * days), 1.0)
+    while expected_total(p) < target_total:
+        p = math.nextafter(p, math.inf)
+    while p > 0.0 and expected_total(math.nextafter(p, 0.0)) >= target_total:
+        p = math.nextafter(p, 0.0)
+    
+    return p
+
+
+def _simulate_kernel(remaining_capacity: MutableSequence[int], p: float, days: int,
+                     draw: Callable[[], float]) -> List[int]:
+    """
+    Core stochastic growth loop over a flat per-referrer capacity list.
+    
+    Instead of one Bernoulli draw per referrer per day, each referrer skips
+    straight to their next successful day: the number of failures before a
+    success is geometric, floor(log(U) / log(1 - p)) for uniform U. Every
+    referrer needs at most one draw per referral they make (plus one to
+    overshoot the horizon), so the loop is O(referrers * capacity + days)
+    regardless of how small p is, with the same distribution as daily trials.
+    
+    Args:
+        remaining_capacity: Referrals each referrer can still make, updated in place
+        p: Probability of successful referral per day (0.0 to 1.0)
+        days: Number of days to simulate
+        draw: Function returning uniform random floats in [0.0, 1.0)
+        
+    Returns:
+        List[int]: Cumulative referrals after each day
+    """
+    daily_referrals = [0] * days
+    
+    if p > 0.0:
+        # Loop invariants hoisted out of the per-draw path; with p == 1 no day is skipped
+        days_per_log = 1.0 / math.log1p(-p) if p < 1.0 else -0.0
+        log = math.log
+        
+        for referrer_id, remaining in enumerate(remaining_capacity):
+            next_day = 0
+            while remaining:
+                # Failed days before this referrer's next success
+                skipped = log(1.0 - draw()) * days_per_log
+                if skipped >= days - next_day:
+                    break  # Next success falls past the horizon
+                success_day = next_day + int(skipped)
+                daily_referrals[success_day] += 1
+                next_day = success_day + 1
+                remaining -= 1
+            remaining_capacity[referrer_id] = remaining
+    
+    return list(itertools.accumulate(daily_referrals))
+
+
 class NetworkSimulator:
     """
     Simulates network growth based on referral success probability and capacity constraints.
@@ -35,16 +188,40 @@ class NetworkSimulator:
             seed: Random seed for reproducible results (None for random)
         """
         self.random_generator = random.Random(seed)
-        self.initial_active_referrers = 100
-        self.max_referrals_per_referrer = 10
+        self.initial_active_referrers = _INITIAL_ACTIVE_REFERRERS
+        self.max_referrals_per_referrer = _MAX_REFERRALS_PER_REFERRER
+        
+        # Per-referrer capacity as packed C ints, copied by each stochastic run and
+        # rebuilt only when the model parameters it was built from change
+        self._capacity_key = (self.initial_active_referrers, self.max_referrals_per_referrer)
+        self._capacity_template = array('i', [self.max_referrals_per_referrer]) * self.initial_active_referrers
+    
+    @staticmethod
+    def _validate_parameters(p: float, days: int) -> None:
+        """
+        Check the probability and horizon shared by both simulations.
+        
+        Args:
+            p: Probability of successful referral per day
+            days: Number of days to simulate
+            
+        Raises:
+            ValueError: If p is not between 0 and 1, or days is negative
+        """
+        if not 0.0 <= p <= 1.0:
+            raise ValueError(_PROBABILITY_RANGE_MESSAGE)
+        
+        if days < 0:
+            raise ValueError(_NEGATIVE_DAYS_MESSAGE)
     
-    def simulate(self, p: float, days: int) -> List[int]:
+    def simulate(self, p: float, days: int, *, seed: Optional[int] = None) -> List[int]:
         """
         Simulate network growth over specified number of days.
         
         Args:
             p: Probability of successful referral per day (0.0 to 1.0)
             days: Number of days to simulate
+            seed: Seed for this run only; None continues the simulator's own stream
             
         Returns:
             List[int]: Cumulative expected referrals for each day
@@ -52,62 +229,80 @@ class NetworkSimulator:
         Raises:
             ValueError: If p is not between 0 and 1, or days is negative
         """
-        if not 0.0 <= p <= 1.0:
-            raise ValueError("Probability p must be between 0.0 and 1.0")
+        self._validate_parameters(p, days)
         
-        if days < 0:
-            raise ValueError("Days must be non-negative")
-        
-        if days == 0:
-            return []
+        if seed is None:
+            return self._run(p, days, self.random_generator.random)
         
-        cumulative_referrals = []
-        current_total = 0
+        # A one-off generator leaves the simulator's own stream untouched
+        return self._run(p, days, random.Random(seed).random)
+    
+    def simulate_many(self, p: float, days: int, n_reps: int) -> List[List[int]]:
+        """
+        Run independent stochastic simulations for variance estimation.
         
-        # Track active referrers and their referral counts
-        active_referrers = self.initial_active_referrers
-        referrer_counts = {i: 0 for i in range(active_referrers)}
+        Each replicate draws from its own generator, seeded from this
+        simulator's stream, so a seeded simulator reproduces the whole batch
+        and replicates never share random numbers.
         
-        for day in range(days):
-            daily_referrals = 0
-            
-            # Process each active referrer
-            referrers_to_deactivate = []
-            
-            for referrer_id in list(referrer_counts.keys()):  # Use list to avoid modification during iteration
-                if referrer_counts[referrer_id] >= self.max_referrals_per_referrer:
-                    referrers_to_deactivate.append(referrer_id)
-                    continue
-                
-                # Attempt referral with probability p
-                if self.random_generator.random() < p:
-                    daily_referrals += 1
-                    referrer_counts[referrer_id] += 1
-                    
-                    # Check if referrer should become inactive
-                    if referrer_counts[referrer_id] >= self.max_referrals_per_referrer:
-                        referrers_to_deactivate.append(referrer_id)
+        Args:
+            p: Probability of successful referral per day (0.0 to 1.0)
+            days: Number of days to simulate
+            n_reps: Number of independent replicates
             
-            # Deactivate referrers who have reached capacity
-            for referrer_id in referrers_to_deactivate:
-                if referrer_id in referrer_counts:
-                    del referrer_counts[referrer_id]
+        Returns:
+            List[List[int]]: Cumulative referrals for each day, one list per replicate
             
-            # Update active referrers count
-            active_referrers = len(referrer_counts)
+        Raises:
+            ValueError: If p is not between 0 and 1, or days or n_reps is negative
+        """
+        self._validate_parameters(p, days)
+        
+        if n_reps < 0:
+            raise ValueError(_NEGATIVE_REPLICATES_MESSAGE)
+        
+        seeds = [self.random_generator.getrandbits(64) for _ in range(n_reps)]
+        return [self._run(p, days, random.Random(seed).random) for seed in seeds]
+    
+    def _run(self, p: float, days: int, draw: Callable[[], float]) -> List[int]:
+        """
+        Run one stochastic simulation with already validated parameters.
+        
+        Args:
+            p: Probability of successful referral per day (0.0 to 1.0)
+            days: Number of days to simulate
+            draw: Function returning uniform random floats in [0.0, 1.0)
             
-            # Update cumulative total
-            current_total += daily_referrals
-            cumulative_referrals.append(current_total)
+        Returns:
+            List[int]: Cumulative referrals for each day
+        """
+        if days == 0:
+            return []
+        
+        # Degenerate probabilities are deterministic and need no random draws
+        if p == 0.0:
+            return [0] * days
+        
+        if p == 1.0:
+            max_referrals = self.max_referrals_per_referrer
+            referrers = self.initial_active_referrers
+            return [min(day, max_referrals) * referrers for day in range(1, days + 1)]
         
-        return cumulative_referrals
+        capacity_key = (self.initial_active_referrers, self.max_referrals_per_referrer)
+        if capacity_key != self._capacity_key:
+            self._capacity_key = capacity_key
+            self._capacity_template = array('i', [self.max_referrals_per_referrer]) * self.initial_active_referrers
+        
+        # The kernel consumes capacity in place, so it gets its own copy
+        return _simulate_kernel(self._capacity_template[:], p, days, draw)
     
     def simulate_expected(self, p: float, days: int) -> List[float]:
         """
         Simulate network growth using expected values (deterministic).
         
         This version uses mathematical expectation rather than random sampling,
-        providing deterministic results useful for analysis.
+        providing deterministic results useful for analysis. Since every
+        referrer behaves identically in expectation, it runs in O(days).
         
         Args:
             p: Probability of successful referral per day (0.0 to 1.0)
@@ -116,64 +311,38 @@ class NetworkSimulator:
         Returns:
             List[float]: Cumulative expected referrals for each day
         """
-        if not 0.0 <= p <= 1.0:
-            raise ValueError("Probability p must be between 0.0 and 1.0")
-        
-        if days < 0:
-            raise ValueError("Days must be non-negative")
+        self._validate_parameters(p, days)
         
         if days == 0:
             return []
         
-        cumulative_referrals = []
-        current_total = 0.0
+        return _expected_curve(p, days, self.initial_active_referrers, self.max_referrals_per_referrer)
+    
+    def _expected_total(self, p: float, days: int) -> float:
+        """
+        Closed-form expected cumulative referrals after a number of days.
         
-        # Track active referrers and their expected referral counts
-        active_referrers = self.initial_active_referrers
-        referrer_counts = {i: 0.0 for i in range(active_referrers)}
+        All referrers are identical in expectation: each gains p expected
+        referrals per day until reaching capacity, so after d days each has
+        min(d * p, max_referrals_per_referrer) and the total scales by the
+        number of referrers.
         
-        for day in range(days):
-            daily_referrals = 0.0
-            
-            # Process each active referrer
-            referrers_to_deactivate = []
-            
-            for referrer_id in range(active_referrers):
-                if referrer_id not in referrer_counts:
-                    continue
-                    
-                if referrer_counts[referrer_id] >= self.max_referrals_per_referrer:
-                    referrers_to_deactivate.append(referrer_id)
-                    continue
-                
-                # Expected referrals for this referrer today
-                expected_today = p
-                daily_referrals += expected_today
-                referrer_counts[referrer_id] += expected_today
-                
-                # Check if referrer should become inactive
-                if referrer_counts[referrer_id] >= self.max_referrals_per_referrer:
-                    referrers_to_deactivate.append(referrer_id)
-            
-            # Deactivate referrers who have reached capacity
-            for referrer_id in referrers_to_deactivate:
-                if referrer_id in referrer_counts:
-                    del referrer_counts[referrer_id]
-            
-            # Update active referrers count
-            active_referrers = len(referrer_counts)
+        Args:
+            p: Probability of successful referral per day (0.0 to 1.0)
+            days: Number of days elapsed
             
-            # Update cumulative total
-            current_total += daily_referrals
-            cumulative_referrals.append(current_total)
-        
-        return cumulative_referrals
+        Returns:
+            float: Cumulative expected referrals after the given days
+        """
+        return min(days * p, self.max_referrals_per_referrer) * self.initial_active_referrers
     
     def days_to_target(self, p: float, target_total: int) -> Optional[int]:
         """
         Calculate days needed to reach target total referrals.
         
-        Uses binary search over simulation results to find the minimum days.
+        Solved analytically: referrers jointly produce N * p expected referrals
+        per day until they reach capacity, so the answer is ceil(target / (N * p)),
+        and the target is impossible if it exceeds the network capacity N * M.
         
         Args:
             p: Probability of successful referral per day
@@ -188,36 +357,27 @@ class NetworkSimulator:
         if p <= 0.0:
             return None  # Impossible with zero probability
         
-        # Estimate upper bound for binary search
-        # With 100 referrers making max 10 referrals each, theoretical max is 1000
-        # But we need to account for daily probability
-        max_days = 1000  # Conservative upper bound
+        if p > 1.0:
+            raise ValueError(_PROBABILITY_RANGE_MESSAGE)
+        
+        # No referrer can exceed capacity, so the total is bounded
+        if target_total > self.initial_active_referrers * self.max_referrals_per_referrer:
+            return None
         
-        # Binary search for minimum days
-        left, right = 0, max_days
+        # Subnormal probabilities need more days than a float can represent
+        estimate = target_total / (self.initial_active_referrers * p)
+        if not math.isfinite(estimate):
+            return None
         
-        while left < right:
-            mid = (left + right) // 2
-            simulation_result = self.simulate_expected(p, mid)
-            
-            if not simulation_result:
-                left = mid + 1
-                continue
-            
-            final_total = simulation_result[-1]
-            
-            if final_total >= target_total:
-                right = mid
-            else:
-                left = mid + 1
+        days = math.ceil(estimate)
         
-        # Verify the result
-        if left <= max_days:
-            final_simulation = self.simulate_expected(p, left)
-            if final_simulation and final_simulation[-1] >= target_total:
-                return left
+        # Align with simulate_expected where floating-point rounding sits on the boundary
+        if self._expected_total(p, days) < target_total:
+            days += 1
+        elif days > 1 and self._expected_total(p, days - 1) >= target_total:
+            days -= 1
         
-        return None
+        return days
 
 
 class ReferralBonusOptimizer:
@@ -232,23 +392,37 @@ class ReferralBonusOptimizer:
     monotonic functions for flexible modeling.
     """
     
-    def __init__(self):
+    def __init__(self, memoize: bool = False):
         """
         Initialize the bonus optimizer.
         
         Note: No base adoption probability is stored as it's now provided
         as a callable function for each optimization call.
+        
+        Args:
+            memoize: Reuse min_bonus_for_target results across calls (default
+                    False). Only safe when adoption_prob is a pure function of
+                    the bonus; call clear_cache() if the underlying model changes.
         """
         self.min_bonus = 10  # Minimum bonus increment
         self.max_bonus = 10000  # Maximum bonus to consider
+        self.memoize = memoize
+        
+        # Recent results of min_bonus_for_target, keyed by its arguments and the bonus grid
+        self._min_bonus_cache: "OrderedDict[tuple, Optional[int]]" = OrderedDict()
+    
+    def clear_cache(self) -> None:
+        """Forget memoized min_bonus_for_target results, e.g. after the adoption model changes."""
+        self._min_bonus_cache.clear()
     
     def min_bonus_for_target(self, days: int, target_hires: int, 
                            adoption_prob: callable, eps: float = 0.01) -> Optional[int]:
         """
         Find minimum bonus amount to achieve hiring target.
         
-        Uses binary search over bonus values to find the minimum bonus
-        that achieves the target within the specified tolerance.
+        The expected-hires closed form is inverted once to get the minimum
+        adoption probability that meets the target; a binary search over the
+        bonus grid then only compares adoption_prob(bonus) against it.
         
         Args:
             days: Number of days available for hiring
@@ -263,6 +437,11 @@ class ReferralBonusOptimizer:
         Raises:
             ValueError: If adoption_prob is not callable or returns invalid probabilities
             TypeError: If adoption_prob function signature is incorrect
+        
+        With memoize=True the most recent results are kept per optimizer in a
+        bounded LRU, keyed by days, target, the adoption_prob object itself
+        (not its id) and the bonus grid, so asking again, e.g. via
+        analyze_bonus_effectiveness, skips the search.
         """
         if days <= 0 or target_hires <= 0:
             return None
@@ -273,6 +452,46 @@ class ReferralBonusOptimizer:
         if eps <= 0.0:
             raise ValueError("Tolerance eps must be positive")
         
+        if not self.memoize:
+            return self._search_min_bonus(days, target_hires, adoption_prob)
+        
+        # eps is only validated, so it does not distinguish results
+        key = (days, target_hires, adoption_prob, self.min_bonus, self.max_bonus)
+        try:
+            result = self._min_bonus_cache[key]
+        except KeyError:
+            pass
+        except TypeError:
+            # Unhashable callables are searched every time
+            return self._search_min_bonus(days, target_hires, adoption_prob)
+        else:
+            self._min_bonus_cache.move_to_end(key)
+            return result
+        
+        result = self._search_min_bonus(days, target_hires, adoption_prob)
+        self._min_bonus_cache[key] = result
+        if len(self._min_bonus_cache) > _MIN_BONUS_CACHE_SIZE:
+            # Drop the least recently used entry and its reference to adoption_prob
+            self._min_bonus_cache.popitem(last=False)
+        return result
+    
+    def _search_min_bonus(self, days: int, target_hires: int,
+                          adoption_prob: callable) -> Optional[int]:
+        """
+        Run the minimum bonus search behind min_bonus_for_target, without memoization.
+        
+        Args:
+            days: Number of days available for hiring (positive)
+            target_hires: Target number of hires to achieve (positive)
+            adoption_prob: Callable mapping a bonus amount to adoption probability
+            
+        Returns:
+            Optional[int]: Minimum bonus amount in $10 increments, or None if impossible
+        """
+        # Memoize for the duration of this call: validation, bracketing and
+        # bisection can probe the same bonus more than once
+        adoption_prob = functools.lru_cache(maxsize=None)(adoption_prob)
+        
         # Validate the adoption_prob function by testing it
         try:
             test_prob = adoption_prob(0)
@@ -286,57 +505,45 @@ class ReferralBonusOptimizer:
                 # For other exceptions, raise TypeError
                 raise TypeError(f"adoption_prob function must accept a bonus parameter: {e}")
         
-        # Create simulator for this scenario
-        simulator = NetworkSimulator()
-        
-        # Check if target is achievable with maximum bonus
-        max_prob = adoption_prob(self.max_bonus)
+        # Check if target is achievable with maximum bonus on the grid
+        increment = self.min_bonus
+        top_bonus = (self.max_bonus // increment) * increment
+        max_prob = adoption_prob(top_bonus)
         if not 0.0 <= max_prob <= 1.0:
-            raise ValueError(f"adoption_prob({self.max_bonus}) returned invalid probability: {max_prob}")
+            raise ValueError(f"adoption_prob({top_bonus}) returned invalid probability: {max_prob}")
         
-        max_bonus_simulation = simulator.simulate_expected(max_prob, days)
-        
-        if not max_bonus_simulation or max_bonus_simulation[-1] < target_hires:
+        # Minimum adoption probability that meets the target, from the closed form
+        min_prob = _min_probability_for_target(days, target_hires, _INITIAL_ACTIVE_REFERRERS,
+                                               _MAX_REFERRALS_PER_REFERRER)
+        if min_prob is None or max_prob < min_prob:
             return None  # Target impossible even with maximum bonus
         
-        # Binary search for minimum bonus
-        left, right = 0, self.max_bonus
+        # The bottom of the grid was already probed (and cached) during validation
+        if adoption_prob(0) >= min_prob:
+            return 0  # Target met without any bonus
+        
+        # Binary search over indices of the bonus grid 0, 10, 20, ..., max_bonus.
+        # The top of the grid is known to be feasible and the bottom infeasible,
+        # so this takes about log2(max_bonus / 10) probes.
+        low, high = 1, top_bonus // increment
         
-        while left < right:
-            mid = (left + right) // 2
-            # Round to nearest $10 increment
-            mid = (mid // 10) * 10
+        while low < high:
+            mid = (low + high) // 2
+            bonus = mid * increment
             
             # Calculate adjusted probability based on bonus using the callable
-            adjusted_prob = adoption_prob(mid)
+            adjusted_prob = adoption_prob(bonus)
             if not 0.0 <= adjusted_prob <= 1.0:
-                raise ValueError(f"adoption_prob({mid}) returned invalid probability: {adjusted_prob}")
-            
-            # Simulate with adjusted probability
-            simulation_result = simulator.simulate_expected(adjusted_prob, days)
-            
-            if not simulation_result:
-                left = mid + 10
-                continue
+                raise ValueError(f"adoption_prob({bonus}) returned invalid probability: {adjusted_prob}")
             
-            final_hires = simulation_result[-1]
-            
-            if final_hires >= target_hires:
-                right = mid
+            if adjusted_prob >= min_prob:
+                high = mid
             else:
-                left = mid + 10
-        
-        # Verify the result
-        if left <= self.max_bonus:
-            final_prob = adoption_prob(left)
-            if not 0.0 <= final_prob <= 1.0:
-                raise ValueError(f"adoption_prob({left}) returned invalid probability: {final_prob}")
-            
-            final_simulation = simulator.simulate_expected(final_prob, days)
-            if final_simulation and final_simulation[-1] >= target_hires:
-                return left
+                low = mid + 1
         
-        return None
+        # Every index the search can settle on was either probed as feasible or
+        # is the top of the grid, so no separate verification pass is needed
+        return low * increment
     
     def analyze_bonus_effectiveness(self, days: int, target_hires: int, 
                                   adoption_prob: callable, eps: float = 0.01) -> dict:
@@ -0,0 +1,27 @@
+"""
+Import-time tests for the source package.
+
+Tests that importing the modules stays lightweight:
+- No JIT or numeric array libraries are pulled in
+"""
+
+from pathlib import Path
+import subprocess
+import sys
+
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+
+class TestImports:
+    """Test suite for package import behavior."""
+
+    def test_import_pulls_in_no_numeric_extensions(self):
+        """Test that importing the package loads no JIT or array libraries."""
+        code = (
+            "import sys, source.referral_network, source.simulation; "
+            "print(sorted(m for m in ('numba', 'numpy', 'scipy') if m in sys.modules))"
+        )
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True,
+                                text=True, check=True, cwd=REPO_ROOT)
+        assert result.stdout.strip() == "[]"
@@ -44,7 +44,21 @@ class TestReferralNetwork:
         assert len(self.network.reverse_referrals["alice"]) == 2
         assert "bob" in self.network.reverse_referrals["alice"]
         assert "charlie" in self.network.reverse_referrals["alice"]
-    
+
+    def test_queries_do_not_create_referral_lists(self):
+        """Test that read-only queries leave reverse_referrals untouched."""
+        self.network.add_referral("alice", "bob")
+        self.network.add_referral("bob", "charlie")
+
+        assert self.network.get_direct_referrals("charlie") == []
+        assert self.network.get_direct_referrals("nobody") == []
+        self.network.get_total_referral_count("alice")
+        self.network.get_unique_reach_expansion()
+        self.network.get_flow_centrality()
+        self.network._compute_shortest_paths("alice")
+
+        assert self.network.reverse_referrals == {"alice": ["bob"], "bob": ["charlie"]}
+
     def test_self_referral_prevention(self):
         """Test that self-referrals are prevented."""
         with pytest.raises(ValueError, match="Self-referrals are not allowed"):
@@ -274,7 +288,27 @@ class TestReferralNetwork:
         assert stats["total_users"] == 0
         assert stats["total_referrals"] == 0
         assert stats["active_referrers"] == 0
-    
+
+    def test_get_network_stats_tracks_inserts(self):
+        """Test that statistics stay current as referrals are added or rejected."""
+        self.network.add_referral("alice", "bob")
+        assert self.network.get_network_stats()["active_referrers"] == 1
+
+        # A second referral by the same user does not add an active referrer
+        self.network.add_referral("alice", "charlie")
+        assert self.network.get_network_stats()["active_referrers"] == 1
+
+        # Rejected referrals leave the statistics unchanged
+        with pytest.raises(ValueError):
+            self.network.add_referral("bob", "alice")
+
+        self.network.add_referral("bob", "david")
+        assert self.network.get_network_stats() == {
+            'total_users': 4,
+            'total_referrals': 3,
+            'active_referrers': 2
+        }
+
     def test_complex_network_scenario(self):
         """Test a complex network scenario with multiple levels."""
         # Create a multi-level referral tree
@@ -489,82 +523,58 @@ class TestReferralNetwork:
         bob_centrality = next(score for user, score in centrality if user == "bob")
         assert bob_centrality > 0
 
-    def test_compute_shortest_paths_isolated_user(self):
-        """Test _compute_shortest_paths with user who has no referrals."""
-        self.network.add_referral("alice", "bob")
-        
-        # bob has no referrals
-        distances = self.network._compute_shortest_paths("bob")
-        assert distances == {"bob": 0}
+    def test_get_flow_centrality_matches_shortest_path_criterion(self):
+        """Test flow centrality against a direct dist(s,v) + dist(v,t) == dist(s,t) count."""
+        edges = [("a", "b"), ("a", "c"), ("b", "d"), ("b", "e"), ("d", "f"),
+                 ("c", "g"), ("x", "y"), ("y", "z")]
+        for referrer, candidate in edges:
+            self.network.add_referral(referrer, candidate)
+
+        distances = {u: self.network._compute_shortest_paths(u) for u in self.network.users}
+        expected = {}
+        for v in self.network.users:
+            expected[v] = sum(
+                1
+                for s in self.network.users if s != v and v in distances[s]
+                for t in distances[v] if t != v
+                if distances[s][v] + distances[v][t] == distances[s].get(t)
+            )
 
-    def test_is_on_shortest_path_edge_cases(self):
-        """Test _is_on_shortest_path with various edge cases."""
+        assert dict(self.network.get_flow_centrality()) == expected
+        assert expected["b"] == 3  # a -> d, a -> e, a -> f
+
+    def test_get_flow_centrality_does_not_run_per_pair_bfs(self):
+        """Test that flow centrality never recomputes single-source shortest paths."""
         self.network.add_referral("alice", "bob")
         self.network.add_referral("bob", "charlie")
-        
-        # Test with same start and end
-        result = self.network._is_on_shortest_path("alice", "alice", "bob", {}, {})
-        assert result == False
-        
-        # Test with target same as start
-        result = self.network._is_on_shortest_path("alice", "charlie", "alice", {}, {})
-        assert result == False
-        
-        # Test with target same as end
-        result = self.network._is_on_shortest_path("alice", "charlie", "charlie", {}, {})
-        assert result == False
 
-    def test_is_on_shortest_path_no_path_conditions(self):
-        """Test _is_on_shortest_path when no path exists."""
-        self.network.add_referral("alice", "bob")
-        
-        # Test when end is not reachable from start
-        distances_from_start = {"alice": 0, "bob": 1}
-        distances_from_target = {"bob": 0, "charlie": 1}
-        
-        result = self.network._is_on_shortest_path("alice", "charlie", "bob", 
-                                                 distances_from_start, distances_from_target)
-        assert result == False
-        
-        # Test when target is not reachable from start
-        distances_from_start = {"alice": 0, "bob": 1}
-        distances_from_target = {"bob": 0, "charlie": 1}
-        
-        result = self.network._is_on_shortest_path("alice", "bob", "charlie", 
-                                                 distances_from_start, distances_from_target)
-        assert result == False
-        
-        # Test when end is not reachable from target
-        distances_from_start = {"alice": 0, "bob": 1, "charlie": 2}
-        distances_from_target = {"bob": 0}
-        
-        result = self.network._is_on_shortest_path("alice", "charlie", "bob", 
-                                                 distances_from_start, distances_from_target)
-        assert result == False
+        def fail(start):
+            raise AssertionError(f"unexpected BFS from {start}")
+
+        self.network._compute_shortest_paths = fail
+
+        assert dict(self.network.get_flow_centrality()) == {"alice": 0, "bob": 1, "charlie": 0}
+
+    def test_get_flow_centrality_large_chain(self):
+        """Test flow centrality on a network well past a few hundred users."""
+        n = 2000
+        for i in range(n - 1):
+            self.network.add_referral(f"user{i}", f"user{i + 1}")
+
+        centrality = dict(self.network.get_flow_centrality())
 
-    def test_is_on_shortest_path_shortest_path_condition(self):
-        """Test _is_on_shortest_path shortest path condition."""
+        # user{d} sits between its d ancestors and its n - 1 - d descendants
+        assert len(centrality) == n
+        for d in (0, 1, 999, 1000, n - 1):
+            assert centrality[f"user{d}"] == d * (n - 1 - d)
+
+    def test_compute_shortest_paths_isolated_user(self):
+        """Test _compute_shortest_paths with user who has no referrals."""
         self.network.add_referral("alice", "bob")
-        self.network.add_referral("bob", "charlie")
-        
-        # Test the actual shortest path condition
-        distances_from_start = {"alice": 0, "bob": 1, "charlie": 2}
-        distances_from_target = {"bob": 0, "charlie": 1}
         
-        # bob should be on shortest path from alice to charlie
-        # dist(alice, bob) = 1, dist(bob, charlie) = 1, dist(alice, charlie) = 2
-        # 1 + 1 = 2, so condition should be true
-        result = self.network._is_on_shortest_path("alice", "charlie", "bob", 
-                                                 distances_from_start, distances_from_target)
-        assert result == True
-        
-        # Test when condition is false
-        # dist(alice, bob) = 1, dist(bob, charlie) = 2, dist(alice, charlie) = 2
-        # 1 + 2 = 3 != 2, so condition should be false
-        distances_from_target = {"bob": 0, "charlie": 2}
-        result = self.network._is_on_shortest_path("alice", "charlie", "bob", 
-                                                 distances_from_start, distances_from_target)
-        assert result == False
+        # bob has no referrals
+        distances = self.network._compute_shortest_paths("bob")
+        assert distances == {"bob": 0}
 
     def test_would_create_cycle_visited_continue(self):
         """Test cycle detection when a candidate is already visited."""
@@ -611,4 +621,102 @@ class TestReferralNetwork:
         # Should count bob and charlie (2 users)
         assert count == 2
 
+    def test_get_top_referrers_matches_total_referral_count(self):
+        """Test that top referrer counts agree with per-user BFS counts."""
+        self.network.add_referral("root", "a")
+        self.network.add_referral("root", "b")
+        self.network.add_referral("a", "c")
+        self.network.add_referral("c", "d")
+        self.network.add_referral("other", "e")
+        
+        top_referrers = self.network.get_top_referrers(10)
+        
+        assert top_referrers[0] == ("root", 4)
+        for user, count in top_referrers:
+            assert count == self.network.get_total_referral_count(user)
+        assert {user for user, _ in top_referrers} == {"root", "a", "c", "other"}
+
+    def test_get_top_referrers_is_prefix_of_full_ranking(self):
+        """Test that a small k returns the head of the full ranking, ties included."""
+        for i in range(20):
+            self.network.add_referral(f"referrer{i}", f"candidate{i}")
+        self.network.add_referral("candidate0", "extra")
+
+        full_ranking = self.network.get_top_referrers(100)
 
+        assert len(full_ranking) == 21
+        assert full_ranking[0] == ("referrer0", 2)
+        for k in (1, 3, 10):
+            assert self.network.get_top_referrers(k) == full_ranking[:k]
+
+    def test_reach_cache_invalidated_on_add_referral(self):
+        """Test that cached reach is refreshed for ancestors after an insert."""
+        self.network.add_referral("alice", "bob")
+        self.network.add_referral("bob", "charlie")
+        
+        # Populate caches
+        assert self.network.get_total_referral_count("alice") == 2
+        assert self.network._get_reachable_users("alice") == {"bob", "charlie"}
+        assert self.network.get_top_referrers(1) == [("alice", 2)]
+        
+        # Extend the chain below a cached user
+        self.network.add_referral("charlie", "david")
+        
+        assert self.network.get_total_referral_count("alice") == 3
+        assert self.network.get_total_referral_count("bob") == 2
+        assert self.network._get_reachable_users("alice") == {"bob", "charlie", "david"}
+        assert self.network.get_top_referrers(1) == [("alice", 3)]
+
+    def test_unique_reach_expansion_refreshed_on_add_referral(self):
+        """Test that cached reach bitmasks are rebuilt after an insert."""
+        self.network.add_referral("alice", "bob")
+        self.network.add_referral("charlie", "david")
+
+        assert self.network.get_unique_reach_expansion() == [("alice", 1), ("charlie", 1)]
+
+        # charlie joins alice's subtree, so alice alone now covers everyone
+        self.network.add_referral("bob", "charlie")
+
+        assert self.network.get_unique_reach_expansion() == [("alice", 3)]
+
+    def test_csr_cached_until_network_changes(self):
+        """Test that the CSR adjacency is reused between queries and rebuilt on change."""
+        self.network.add_referral("alice", "bob")
+        self.network.add_referral("alice", "charlie")
+
+        csr = self.network._get_csr()
+        self.network.get_flow_centrality()
+        self.network.get_unique_reach_expansion()
+        assert self.network._get_csr() is csr
+
+        self.network.add_referral("bob", "david")
+        indptr, indices = self.network._get_csr()
+        users_by_id = self.network._users_by_id
+        bob = self.network._id_of["bob"]
+        assert [users_by_id[c] for c in indices[indptr[bob]:indptr[bob + 1]]] == ["david"]
+
+        # Users added directly to the user set are picked up as well
+        self.network.users.add("isolated")
+        indptr, _ = self.network._get_csr()
+        assert len(indptr) == len(self.network.users) + 1
+
+    def test_would_create_cycle_leaf_candidate(self):
+        """Test that a candidate with no referrals never creates a cycle."""
+        self.network.add_referral("alice", "bob")
+        self.network.add_referral("bob", "charlie")
+        
+        assert self.network._would_create_cycle("charlie", "david") == False
+        assert self.network._would_create_cycle("alice", "charlie") == False
+        assert self.network._would_create_cycle("charlie", "alice") == True
+
+    def test_cycle_prevention_deep_chain(self):
+        """Test cycle detection on a long chain walks ancestors without recursion."""
+        for i in range(5000):
+            self.network.add_referral(f"user_{i}", f"user_{i+1}")
+        
+        with pytest.raises(ValueError, match="Adding this referral would create a cycle"):
+            self.network.add_referral("user_5000", "user_0")
+        
+        # Branching off the middle of the chain is still allowed
+        assert self.network.add_referral("user_2500", "side_user") is True
+        assert self.network.get_total_referral_count("user_0") == 5001
@@ -10,7 +10,10 @@ Tests all functionality including:
 """
 
 import pytest
-from source.simulation import NetworkSimulator, ReferralBonusOptimizer
+from source.simulation import (
+    NetworkSimulator, ReferralBonusOptimizer, _MIN_BONUS_CACHE_SIZE, _min_probability_for_target,
+    _saturation_day, _simulate_kernel,
+)
 import math
 
 
@@ -136,7 +139,55 @@ class TestNetworkSimulator:
         # Should have expected referrals
         assert result[0] == 50.0  # Day 1: 100 * 0.5 = 50 expected referrals
         assert result[1] == 100.0  # Day 2: 100 * 0.5 = 50 more, total 100
-    
+
+    def test_simulate_expected_plateau_after_saturation(self):
+        """Test that expected growth is flat at capacity once referrers saturate."""
+        for p in (0.1, 0.3, 0.7):
+            result = self.simulator.simulate_expected(p, 120)
+
+            for day, total in enumerate(result, start=1):
+                assert total == self.simulator._expected_total(p, day)
+
+            saturation_day = next(day for day, total in enumerate(result, start=1) if total == 1000)
+            assert all(total == 1000 for total in result[saturation_day - 1:])
+            assert result[saturation_day - 2] < 1000
+
+    def test_simulate_expected_subnormal_probability(self):
+        """Test that tiny probabilities give a linear curve instead of overflowing."""
+        result = self.simulator.simulate_expected(5e-324, 3)
+
+        assert result == [day * 5e-324 * 100 for day in range(1, 4)]
+
+    def test_saturation_day_is_first_day_at_capacity(self):
+        """Test that the saturation day is the first day reaching capacity."""
+        for p in (0.1, 0.3, 0.7, 1.0):
+            day = _saturation_day(p, 10)
+
+            assert day * p >= 10
+            assert day == 1 or (day - 1) * p < 10
+
+    def test_simulate_expected_saturates_on_last_day(self):
+        """Test that a curve reaching capacity exactly at the horizon plateaus there."""
+        result = self.simulator.simulate_expected(0.5, 20)
+
+        assert result[-2] == 950.0
+        assert result[-1] == 1000.0
+
+    def test_simulations_return_fresh_plain_lists(self):
+        """Test that preallocated results are plain lists owned by each caller."""
+        for p in (0.0, 0.5, 1.0):
+            first = self.simulator.simulate(p, 5)
+            second = self.simulator.simulate(p, 5)
+            assert type(first) is list and all(type(total) is int for total in first)
+            assert first is not second
+
+        result = self.simulator.simulate_expected(0.5, 5)
+        assert type(result) is list
+        result[0] = -1.0
+        result.append(0.0)
+
+        assert self.simulator.simulate_expected(0.5, 5) == [50.0, 100.0, 150.0, 200.0, 250.0]
+
     def test_simulate_expected_invalid_probability(self):
         """Test expected simulation with invalid probability values."""
         with pytest.raises(ValueError, match="Probability p must be between 0.0 and 1.0"):
@@ -174,6 +225,44 @@ class TestNetworkSimulator:
         result = self.simulator.days_to_target(0.001, 10000)
         # This may or may not be achievable, but should not crash
     
+    def test_days_to_target_matches_expected_simulation(self):
+        """Test that days to target is the first day the expected total reaches target."""
+        for p, target in [(0.1, 100), (0.3, 1000), (0.5, 101), (0.001, 101)]:
+            days = self.simulator.days_to_target(p, target)
+            expected = self.simulator.simulate_expected(p, days)
+            assert expected[-1] >= target
+            assert days == 1 or expected[-2] < target
+    
+    def test_days_to_target_above_capacity(self):
+        """Test that targets above total referral capacity are impossible."""
+        assert self.simulator.days_to_target(1.0, 1000) == 10
+        assert self.simulator.days_to_target(1.0, 1001) is None
+
+    def test_days_to_target_long_horizon(self):
+        """Test that tiny probabilities are solved directly, without a day-by-day search."""
+        assert self.simulator.days_to_target(1e-6, 1) == 10_000
+        assert self.simulator.days_to_target(1e-6, 1000) == 10_000_000
+
+        days = self.simulator.days_to_target(3e-7, 999)
+        assert self.simulator._expected_total(3e-7, days) >= 999
+        assert self.simulator._expected_total(3e-7, days - 1) < 999
+
+    def test_days_to_target_subnormal_probability(self):
+        """Test that probabilities too small for a finite day count are impossible."""
+        assert self.simulator.days_to_target(1e-320, 1) is None
+        assert self.simulator.days_to_target(5e-324, 1000) is None
+
+    def test_min_probability_for_target_is_exact_boundary(self):
+        """Test that the inverted probability is the exact threshold of the closed form."""
+        for days, target in [(1, 1), (3, 100), (7, 333), (10, 1000), (30, 999), (50, 1000)]:
+            p = _min_probability_for_target(days, target, 100, 10)
+
+            assert self.simulator._expected_total(p, days) >= target
+            assert self.simulator._expected_total(math.nextafter(p, 0.0), days) < target
+
+        assert _min_probability_for_target(5, 501, 100, 10) is None
+        assert _min_probability_for_target(100, 1001, 100, 10) is None
+
     def test_simulation_reproducibility(self):
         """Test that simulations with same seed are reproducible."""
         simulator1 = NetworkSimulator(seed=123)
@@ -183,7 +272,104 @@ class TestNetworkSimulator:
         result2 = simulator2.simulate(0.3, 10)
         
         assert result1 == result2
-    
+
+    def test_simulation_per_call_seed_replay(self):
+        """Test that a per-call seed replays a run on a single simulator."""
+        state = self.simulator.random_generator.getstate()
+
+        result1 = self.simulator.simulate(0.3, 10, seed=123)
+        result2 = self.simulator.simulate(0.3, 10, seed=123)
+
+        assert result1 == result2
+        assert result1 == NetworkSimulator(seed=123).simulate(0.3, 10)
+        assert self.simulator.random_generator.getstate() == state  # Own stream untouched
+
+    def test_simulation_stream_reproducibility(self):
+        """Test that a seeded simulator replays the same sequence of runs."""
+        simulator1 = NetworkSimulator(seed=7)
+        simulator2 = NetworkSimulator(seed=7)
+
+        runs1 = [simulator1.simulate(p, 30) for p in (0.05, 0.3, 0.05)]
+        runs2 = [simulator2.simulate(p, 30) for p in (0.05, 0.3, 0.05)]
+
+        assert runs1 == runs2
+        assert runs1[0] != runs1[2]  # Later runs continue the stream
+        assert NetworkSimulator(seed=8).simulate(0.05, 30) != runs1[0]
+
+    def test_simulate_degenerate_probabilities_draw_nothing(self):
+        """Test that p = 0 and p = 1 are answered without consuming random draws."""
+        state = self.simulator.random_generator.getstate()
+
+        assert self.simulator.simulate(0.0, 5) == [0] * 5
+        assert self.simulator.simulate(1.0, 12) == [100 * day for day in range(1, 11)] + [1000] * 2
+        assert self.simulator.random_generator.getstate() == state
+
+    def test_simulate_kernel_with_fixed_draws(self):
+        """Test the simulation kernel directly with a deterministic draw function."""
+        # A draw of 0.0 skips no days, so each referrer succeeds daily until capacity
+        remaining_capacity = [3, 1, 0]
+        result = _simulate_kernel(remaining_capacity, 0.5, 5, lambda: 0.0)
+
+        assert result == [2, 3, 4, 4, 4]
+        assert remaining_capacity == [0, 0, 0]
+
+        # A draw of 0.5 at p = 0.5 skips exactly one day before each success
+        remaining_capacity = [3]
+        assert _simulate_kernel(remaining_capacity, 0.5, 5, lambda: 0.5) == [0, 1, 1, 2, 2]
+        assert remaining_capacity == [1]
+
+    def test_simulate_many_reproducible_batches(self):
+        """Test that replicate batches are independent but reproducible from the seed."""
+        batch1 = NetworkSimulator(seed=11).simulate_many(0.2, 30, 5)
+        batch2 = NetworkSimulator(seed=11).simulate_many(0.2, 30, 5)
+
+        assert batch1 == batch2
+        assert len(batch1) == 5
+        assert all(len(run) == 30 and run[-1] <= 1000 for run in batch1)
+        assert len({tuple(run) for run in batch1}) == 5  # Replicates differ
+
+    def test_simulate_many_edge_cases(self):
+        """Test replicate batches with degenerate inputs."""
+        assert self.simulator.simulate_many(0.5, 10, 0) == []
+        assert self.simulator.simulate_many(0.5, 0, 3) == [[], [], []]
+        assert self.simulator.simulate_many(1.0, 2, 2) == [[100, 200], [100, 200]]
+
+        with pytest.raises(ValueError, match="Number of replicates must be non-negative"):
+            self.simulator.simulate_many(0.5, 10, -1)
+
+        with pytest.raises(ValueError, match="Probability p must be between 0.0 and 1.0"):
+            self.simulator.simulate_many(1.5, 10, 2)
+
+    def test_simulate_calls_start_from_fresh_capacity(self):
+        """Test that each simulation starts with every referrer at zero referrals."""
+        expected = [100 * day for day in range(1, 11)] + [1000] * 5
+
+        assert self.simulator.simulate(1.0, 15) == expected
+        assert self.simulator.simulate(1.0, 15) == expected
+
+    def test_simulate_uses_current_model_parameters(self):
+        """Test that changing the referrer count or capacity affects later simulations."""
+        self.simulator.initial_active_referrers = 5
+        self.simulator.max_referrals_per_referrer = 2
+
+        assert self.simulator.simulate(1.0, 3) == [5, 10, 10]
+        assert self.simulator.simulate(0.999999, 3) == [5, 10, 10]
+        assert max(self.simulator.simulate_expected(0.999999, 3)) == 10.0
+        assert self.simulator.simulate(0.5, 50)[-1] == 10
+
+    def test_simulate_reuses_capacity_template(self):
+        """Test that runs copy the capacity template and rebuild it only on parameter changes."""
+        template = self.simulator._capacity_template
+        self.simulator.simulate(0.9, 30)
+        self.simulator.simulate(0.9, 30)
+
+        assert self.simulator._capacity_template is template
+        assert list(template) == [10] * 100
+
+        self.simulator.max_referrals_per_referrer = 3
+        assert self.simulator.simulate(0.999999, 5)[-1] == 300
+        assert list(self.simulator._capacity_template) == [3] * 100
+
     def test_capacity_constraint(self):
         """Test that referrers become inactive after reaching capacity."""
         result = self.simulator.simulate_expected(1.0, 15)
@@ -193,6 +379,30 @@ class TestNetworkSimulator:
         assert result[9] == 1000  # Day 10: 100 * 10 = 1000 referrals
         assert result[10] == 1000  # Day 11: No more referrals
         assert result[14] == 1000  # Day 15: Still no more referrals
+    
+    def test_capacity_constraint_fractional_probability(self):
+        """Test that expected referrals never exceed capacity when p does not divide it."""
+        result = self.simulator.simulate_expected(0.3, 40)
+        
+        # Each referrer needs 34 days to reach 10 expected referrals at p=0.3
+        assert result[32] == pytest.approx(990.0)
+        assert result[33] == 1000  # Day 34: capped at capacity, not 1020
+        assert result[39] == 1000
+
+    def test_simulate_mean_matches_expected(self):
+        """Test that stochastic runs average out to the expected-value curve."""
+        p, days, runs = 0.05, 300, 200
+        expected = self.simulator.simulate_expected(p, days)
+
+        totals = [0] * days
+        for seed in range(runs):
+            for day, total in enumerate(NetworkSimulator(seed=seed).simulate(p, days)):
+                totals[day] += total
+
+        # Well before saturation, capacity rarely binds: 5 after day 1, 250 after day 50, 500 after day 100
+        for day in (0, 49, 99):
+            assert totals[day] / runs == pytest.approx(expected[day], rel=0.05, abs=0.5)
+        assert totals[-1] / runs <= 1000
 
 
 class TestReferralBonusOptimizer:
@@ -283,7 +493,24 @@ class TestReferralBonusOptimizer:
         result = self.optimizer.min_bonus_for_target(10, 100, high_prob, eps=0.1)
         assert result is not None
         # May need very little or no bonus
-    
+
+    def test_min_bonus_for_target_bracket_short_circuits(self):
+        """Test that targets decided at either end of the grid skip the binary search."""
+        calls = []
+
+        def counting_prob(bonus):
+            calls.append(bonus)
+            return 0.8 if bonus >= 5000 else 0.2
+
+        # Already met with no bonus: only the two ends of the grid are probed
+        assert self.optimizer.min_bonus_for_target(10, 100, counting_prob) == 0
+        assert sorted(calls) == [0, 10000]
+
+        # Out of reach even at the top of the grid
+        calls.clear()
+        assert self.optimizer.min_bonus_for_target(5, 500, counting_prob) is None
+        assert sorted(calls) == [0, 10000]
+
     def test_bonus_increments(self):
         """Test that bonus amounts are in $10 increments."""
         def linear_prob(bonus):
@@ -352,6 +579,98 @@ class TestReferralBonusOptimizer:
         with pytest.raises(ValueError, match="returned invalid probability: 1.5"):
             self.optimizer.min_bonus_for_target(30, 50, invalid_prob)
     
+    def test_min_bonus_for_target_evaluates_each_bonus_once(self):
+        """Test that adoption_prob is not re-evaluated for the same bonus."""
+        calls = []
+        
+        def counting_prob(bonus):
+            calls.append(bonus)
+            return min(0.1 + bonus / 1000.0, 1.0)
+        
+        result = self.optimizer.min_bonus_for_target(10, 300, counting_prob)
+        
+        assert result is not None
+        assert result % 10 == 0
+        assert len(calls) == len(set(calls))
+        assert len(calls) <= 15  # validation + bracket + ~log2(1001) probes
+
+    def test_min_bonus_for_target_does_not_cache_across_calls(self):
+        """Test that adoption_prob results are only memoized within one call."""
+        rates = {"base": 0.1}
+
+        def shifting_prob(bonus):
+            return min(rates["base"] + bonus / 1000.0, 1.0)
+
+        first = self.optimizer.min_bonus_for_target(10, 500, shifting_prob)
+        rates["base"] = 0.3
+        second = self.optimizer.min_bonus_for_target(10, 500, shifting_prob)
+
+        assert first == 400
+        assert second == 200
+
+    def test_min_bonus_for_target_memoizes_results_when_enabled(self):
+        """Test that an opted-in optimizer reuses results without re-probing."""
+        optimizer = ReferralBonusOptimizer(memoize=True)
+        calls = []
+
+        def counting_prob(bonus):
+            calls.append(bonus)
+            return min(0.1 + bonus / 1000.0, 1.0)
+
+        first = optimizer.min_bonus_for_target(10, 500, counting_prob)
+        probes = len(calls)
+        analysis = optimizer.analyze_bonus_effectiveness(10, 500, counting_prob)
+
+        assert first == 400
+        assert analysis['min_bonus'] == first
+        assert len(calls) == probes
+
+        # eps does not change the answer, so it is not part of the key
+        assert optimizer.min_bonus_for_target(10, 500, counting_prob, eps=0.02) == first
+        assert len(calls) == probes
+
+        with pytest.raises(ValueError, match="Tolerance eps must be positive"):
+            optimizer.min_bonus_for_target(10, 500, counting_prob, eps=0.0)
+
+    def test_min_bonus_for_target_clear_cache(self):
+        """Test that clearing the cache picks up a changed adoption model."""
+        optimizer = ReferralBonusOptimizer(memoize=True)
+        rates = {"base": 0.1}
+
+        def shifting_prob(bonus):
+            return min(rates["base"] + bonus / 1000.0, 1.0)
+
+        assert optimizer.min_bonus_for_target(10, 500, shifting_prob) == 400
+        rates["base"] = 0.3
+        optimizer.clear_cache()
+
+        assert optimizer.min_bonus_for_target(10, 500, shifting_prob) == 200
+
+    def test_min_bonus_for_target_cache_is_bounded(self):
+        """Test that memoized results do not grow without bound across callables."""
+        optimizer = ReferralBonusOptimizer(memoize=True)
+        for step in range(_MIN_BONUS_CACHE_SIZE + 50):
+            optimizer.min_bonus_for_target(10, 500, lambda bonus, step=step: min(0.1 + bonus / 1000.0, 1.0))
+
+        assert len(optimizer._min_bonus_cache) == _MIN_BONUS_CACHE_SIZE
+
+    def test_min_bonus_for_target_cache_keeps_recent_results(self):
+        """Test that a result used again survives eviction of older entries."""
+        optimizer = ReferralBonusOptimizer(memoize=True)
+        calls = []
+
+        def counted_prob(bonus):
+            calls.append(bonus)
+            return min(0.1 + bonus / 1000.0, 1.0)
+
+        assert optimizer.min_bonus_for_target(10, 500, counted_prob) == 400
+        searched = len(calls)
+        for step in range(2 * _MIN_BONUS_CACHE_SIZE):
+            optimizer.min_bonus_for_target(10, 500, lambda bonus, step=step: min(0.1 + bonus / 1000.0, 1.0))
+            assert optimizer.min_bonus_for_target(10, 500, counted_prob) == 400
+
+        assert len(calls) == searched
+
     def test_analyze_bonus_effectiveness_achievable(self):
         """Test bonus effectiveness analysis with achievable target."""
         def linear_prob(bonus):